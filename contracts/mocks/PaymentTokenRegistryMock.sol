@@ -0,0 +1,13 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.0;
+
+import "../PaymentTokenRegistry.sol";
+
+contract PaymentTokenRegistryMock is PaymentTokenRegistry {
+    function addBatch(address[] memory tokens) public onlyOwner {
+        for (uint256 i = 0; i < tokens.length; i++) {
+            add(tokens[i]);
+        }
+    }
+}
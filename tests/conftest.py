@@ -1,11 +1,12 @@
 import pytest
-from brownie import PaymentTokenRegistry, ERC721CollectionMock, ERC721CollectionFactory, ERC1155CollectionMock, \
+from brownie import PaymentTokenRegistryMock, ERC721CollectionMock, ERC721CollectionFactory, ERC1155CollectionMock, \
     ERC1155MarketplaceMock, MarketplaceBaseMock, AddressRegistry, ERC20TokenMock, RoyaltyRegistry, accounts, \
-    ERC721MarketplaceMock, ZERO_ADDRESS, Wei
+    ERC721MarketplaceMock, ZERO_ADDRESS, Wei, chain
 import utils.constants
+from utils.helpers import wait_for_txs
 from brownie.network.contract import ProjectContract
 from brownie.network.account import LocalAccount
-from typing import Callable
+from typing import Callable, Iterator, List
 
 
 @pytest.fixture(scope="session")
@@ -33,7 +34,12 @@ def user_4() -> LocalAccount:
     return accounts[4]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def available_accounts(owner: LocalAccount) -> List[LocalAccount]:
+    return [account for account in accounts if account.address != owner.address]
+
+
+@pytest.fixture(scope="session")
 def erc20_mock(owner: LocalAccount, user: LocalAccount, user_2: LocalAccount, user_3: LocalAccount) -> ProjectContract:
     contract = ERC20TokenMock.deploy(
         utils.constants.TEST_TOKEN_NAME,
@@ -42,70 +48,76 @@ def erc20_mock(owner: LocalAccount, user: LocalAccount, user_2: LocalAccount, us
         utils.constants.TEST_TOKEN_OWNER_AMOUNT,
         {'from': owner}
     )
-    contract.mint(user, utils.constants.TEST_TOKEN_USER_AMOUNT)
-    contract.mint(user_2, utils.constants.TEST_TOKEN_USER_2_AMOUNT)
-    contract.mint(user_3, utils.constants.TEST_TOKEN_USER_3_AMOUNT)
+    wait_for_txs([
+        contract.mint(user, utils.constants.TEST_TOKEN_USER_AMOUNT, {'required_confs': 0}),
+        contract.mint(user_2, utils.constants.TEST_TOKEN_USER_2_AMOUNT, {'required_confs': 0}),
+        contract.mint(user_3, utils.constants.TEST_TOKEN_USER_3_AMOUNT, {'required_confs': 0})
+    ])
     return contract
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def payment_token(erc20_mock: ProjectContract) -> ProjectContract:
     return erc20_mock
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def payment_token_registry(owner: LocalAccount, erc20_mock: ProjectContract) -> ProjectContract:
-    contract = PaymentTokenRegistry.deploy({'from': owner})
-    contract.add(utils.constants.TOMB_TOKEN)
-    contract.add(utils.constants.ZOO_TOKEN)
-    contract.add(utils.constants.WFTM_TOKEN)
-    contract.add(erc20_mock)
+    contract = PaymentTokenRegistryMock.deploy({'from': owner})
+    contract.addBatch([
+        utils.constants.TOMB_TOKEN,
+        utils.constants.ZOO_TOKEN,
+        utils.constants.WFTM_TOKEN,
+        erc20_mock
+    ])
     return contract
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def royalty_registry(owner: LocalAccount) -> ProjectContract:
     return RoyaltyRegistry.deploy({'from': owner})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def address_registry(
         payment_token_registry: ProjectContract,
         royalty_registry: ProjectContract,
         owner: LocalAccount
 ) -> ProjectContract:
     contract = AddressRegistry.deploy({'from': owner})
-    contract.updatePaymentTokenRegistryAddress(payment_token_registry, {'from': owner})
-    contract.updateRoyaltyRegistryAddress(royalty_registry, {'from': owner})
+    wait_for_txs([
+        contract.updatePaymentTokenRegistryAddress(payment_token_registry, {'from': owner, 'required_confs': 0}),
+        contract.updateRoyaltyRegistryAddress(royalty_registry, {'from': owner, 'required_confs': 0})
+    ])
     return contract
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def erc1155_marketplace_mock(address_registry: ProjectContract, owner: LocalAccount) -> ProjectContract:
     contract = ERC1155MarketplaceMock.deploy({'from': owner})
     contract.initialize(address_registry, 25, 25, 25, owner, True)
     return contract
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def erc1155_collection_mock(owner: LocalAccount) -> ProjectContract:
     return ERC1155CollectionMock.deploy({'from': owner})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def erc1155_collection_mint(erc1155_collection_mock: ProjectContract) -> Callable:
     return lambda recipient, amount=1: \
         erc1155_collection_mock.mintAndGetTokenId(recipient, amount).return_value
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def erc721_marketplace_mock(address_registry: ProjectContract, owner: LocalAccount) -> ProjectContract:
     contract = ERC721MarketplaceMock.deploy({'from': owner})
     contract.initialize(address_registry, 25, 25, 25, owner, True)
     return contract
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def erc721_collection_mock(owner: LocalAccount) -> ProjectContract:
     return ERC721CollectionMock.deploy(
         utils.constants.COLLECTION_NAME,
@@ -117,21 +129,37 @@ def erc721_collection_mock(owner: LocalAccount) -> ProjectContract:
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def mint_fee_recipient(erc721_collection_mock: ProjectContract) -> LocalAccount:
+    return accounts.at(erc721_collection_mock.getMintFeeRecipient())
+
+
+@pytest.fixture(scope="session")
 def erc721_collection_mint(erc721_collection_mock: ProjectContract) -> Callable:
     return lambda recipient, token_uri='some+uri', royalty_recipient=ZERO_ADDRESS, royalty_percent=0: \
         erc721_collection_mock.mintAndGetTokenId(recipient, token_uri, royalty_recipient, royalty_percent).return_value
 
 
-@pytest.fixture(scope="module")
-def erc721_collection_factory() -> ProjectContract:
-    contract = accounts[0].deploy(ERC721CollectionFactory, Wei('5 ether'), accounts[0])
-    return contract
+@pytest.fixture(scope="session")
+def erc721_collection_factory(owner: LocalAccount) -> ProjectContract:
+    return ERC721CollectionFactory.deploy(Wei('5 ether'), owner, {'from': owner})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def reset_chain() -> Iterator[None]:
+    # the chain is not reset between modules, so wipe the session deployments once all tests are done,
+    # in case brownie is connected to a long-lived ganache (e.g. the docker ganache-cli container)
+    yield
+    chain.reset()
 
 
 @pytest.fixture(scope="function", autouse=True)
-def isolate(fn_isolation) -> None:
+def isolate() -> Iterator[None]:
     # perform a chain rewind after completing each test, to ensure proper isolation
+    # unlike brownie's fn_isolation, the chain is not reset between modules, so the session
+    # scoped deployments above are done once per session (or once per xdist worker)
     # https://eth-brownie.readthedocs.io/en/v1.10.3/tests-pytest-intro.html#isolation-fixtures
-    pass
+    chain.snapshot()
+    yield
+    chain.revert()
 
@@ -7,7 +7,7 @@ from typing import Callable
 from utils.structs import ERC1155Auction, Auction, HighestBid
 from brownie import reverts, chain, accounts, ZERO_ADDRESS
 from brownie.test import given, strategy
-from utils.helpers import calculate_auction_fee, calculate_royalty_fee
+from utils.helpers import calculate_auction_fee, calculate_royalty_fee, assert_event
 from hypothesis import settings
 
 
@@ -16,10 +16,18 @@ class AuctionParams:
     token_id: int = 1_000_000
     token_amount: int = 10
     reserve_price: int = 50
-    start_time: int = chain.time() + (60 * 30)  # start auction at current time + 30 minutes
-    end_time: int = start_time + (60 * 60 * 2)  # end auction in 2 hours from start
+    duration: int = 60 * 60 * 2  # end auction in 2 hours from start
     auction_id: int = 1
 
+    @classmethod
+    def start_time(cls) -> int:
+        # start auction at current time + 30 minutes
+        return chain.time() + (60 * 30)
+
+    @classmethod
+    def end_time(cls) -> int:
+        return cls.start_time() + cls.duration
+
 
 @dataclass(frozen=True)
 class HighestBidParams:
@@ -60,7 +68,7 @@ def royalty_recipient(user_4: LocalAccount) -> LocalAccount:
 def handle_auction_status(status: AuctionStatus) -> None:
     if status is not AuctionStatus.NOT_STARTED:
         chain.sleep(
-            (AuctionParams.end_time if status is AuctionStatus.ENDED else AuctionParams.start_time) - chain.time()
+            (AuctionParams.end_time() if status is AuctionStatus.ENDED else AuctionParams.start_time()) - chain.time()
         )
         chain.mine()
 
@@ -94,8 +102,8 @@ def setup_auction(
             seller,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.end_time,
+            AuctionParams.start_time(),
+            AuctionParams.end_time(),
             is_min_bid_reserve_price
         )
         # start/end auction
@@ -173,13 +181,16 @@ def test_create_auction(
     assert erc1155_collection_mock.balanceOf(erc1155_marketplace_mock, token_id) == auction_token_amount
 
     # asset event emitted correctly
-    assert tx.events['ERC1155AuctionCreated'] is not None
-    assert tx.events['ERC1155AuctionCreated']['nftAddress'] == erc1155_collection_mock.address
-    assert tx.events['ERC1155AuctionCreated']['tokenId'] == token_id
-    assert tx.events['ERC1155AuctionCreated']['auctionId'] == AuctionParams.auction_id
-    assert tx.events['ERC1155AuctionCreated']['owner'] == seller.address
-    assert tx.events['ERC1155AuctionCreated']['tokenAmount'] == auction_token_amount
-    assert tx.events['ERC1155AuctionCreated']['payToken'] == payment_token.address
+    assert_event(
+        tx,
+        'ERC1155AuctionCreated',
+        nftAddress=erc1155_collection_mock.address,
+        tokenId=token_id,
+        auctionId=AuctionParams.auction_id,
+        owner=seller.address,
+        tokenAmount=auction_token_amount,
+        payToken=payment_token.address
+    )
 
     # assert auction created
     data = erc1155_marketplace_mock.getAuction(erc1155_collection_mock, token_id, seller, AuctionParams.auction_id)
@@ -212,8 +223,8 @@ def test_create_auction_invalid_token_type(
             AuctionParams.auction_id,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.end_time,
+            AuctionParams.start_time(),
+            AuctionParams.end_time(),
             False,
             {'from': seller}
         )
@@ -238,8 +249,8 @@ def test_create_auction_invalid_payment_token(
             AuctionParams.auction_id,
             token_address,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.end_time,
+            AuctionParams.start_time(),
+            AuctionParams.end_time(),
             False,
             {'from': seller}
         )
@@ -254,6 +265,7 @@ def test_create_auction_invalid_time_maximum_duration(
 ) -> None:
     """Test auction creation with invalid time - maximum duration"""
     token_id = erc1155_collection_mint_with_approval(seller, AuctionParams.token_amount)
+    start_time = AuctionParams.start_time()
     with reverts('MarketplaceBase: Auction time exceeds maximum duration'):
         erc1155_marketplace_mock.createAuction(
             erc1155_collection_mock,
@@ -262,8 +274,8 @@ def test_create_auction_invalid_time_maximum_duration(
             AuctionParams.auction_id,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.start_time + (erc1155_marketplace_mock.getMaximumAuctionDuration() + 1),
+            start_time,
+            start_time + (erc1155_marketplace_mock.getMaximumAuctionDuration() + 1),
             False,
             {'from': seller}
         )
@@ -278,6 +290,7 @@ def test_create_auction_invalid_time_minimum_duration(
 ) -> None:
     """Test auction creation with invalid time - minimum duration"""
     token_id = erc1155_collection_mint_with_approval(seller, AuctionParams.token_amount)
+    start_time = AuctionParams.start_time()
     with reverts('MarketplaceBase: Auction time does not meet minimum duration'):
         erc1155_marketplace_mock.createAuction(
             erc1155_collection_mock,
@@ -286,8 +299,8 @@ def test_create_auction_invalid_time_minimum_duration(
             AuctionParams.auction_id,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.start_time + (erc1155_marketplace_mock.getMinimumAuctionDuration() - 1),
+            start_time,
+            start_time + (erc1155_marketplace_mock.getMinimumAuctionDuration() - 1),
             False,
             {'from': seller}
         )
@@ -310,8 +323,8 @@ def test_create_auction_already_exists(
             AuctionParams.auction_id,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.end_time,
+            AuctionParams.start_time(),
+            AuctionParams.end_time(),
             False,
             {'from': seller}
         )
@@ -351,13 +364,16 @@ def test_place_bid(
     assert highest_bid.bidder == bidder.address
 
     # asset event emitted correctly
-    assert tx.events['ERC1155BidPlaced'] is not None
-    assert tx.events['ERC1155BidPlaced']['nftAddress'] == erc1155_collection_mock.address
-    assert tx.events['ERC1155BidPlaced']['nftOwner'] == seller.address
-    assert tx.events['ERC1155BidPlaced']['tokenId'] == AuctionParams.token_id
-    assert tx.events['ERC1155BidPlaced']['auctionId'] == AuctionParams.auction_id
-    assert tx.events['ERC1155BidPlaced']['bidder'] == bidder.address
-    assert tx.events['ERC1155BidPlaced']['bid'] == bid_amount
+    assert_event(
+        tx,
+        'ERC1155BidPlaced',
+        nftAddress=erc1155_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=AuctionParams.token_id,
+        auctionId=AuctionParams.auction_id,
+        bidder=bidder.address,
+        bid=bid_amount
+    )
 
     # assert tokens transferred
     assert payment_token.balanceOf(bidder) == initial_bidder_balance - bid_amount
@@ -479,13 +495,16 @@ def test_place_bid_outbid_highest_bid(
            == initial_marketplace_balance - HighestBidParams.bid_amount + bid_amount
 
     # asset event emitted correctly
-    assert tx.events['ERC1155BidRefunded'] is not None
-    assert tx.events['ERC1155BidRefunded']['nftAddress'] == erc1155_collection_mock.address
-    assert tx.events['ERC1155BidRefunded']['nftOwner'] == seller.address
-    assert tx.events['ERC1155BidRefunded']['tokenId'] == AuctionParams.token_id
-    assert tx.events['ERC1155BidRefunded']['auctionId'] == AuctionParams.auction_id
-    assert tx.events['ERC1155BidRefunded']['bidder'] == bidder.address
-    assert tx.events['ERC1155BidRefunded']['bid'] == HighestBidParams.bid_amount
+    assert_event(
+        tx,
+        'ERC1155BidRefunded',
+        nftAddress=erc1155_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=AuctionParams.token_id,
+        auctionId=AuctionParams.auction_id,
+        bidder=bidder.address,
+        bid=HighestBidParams.bid_amount
+    )
 
 
 def test_place_bid_below_previous_highest_bid(
@@ -572,19 +591,25 @@ def test_cancel_auction(
            initial_marketplace_token_amount - AuctionParams.token_amount
 
     # asset events emitted correctly
-    assert tx.events['ERC1155AuctionCancelled'] is not None
-    assert tx.events['ERC1155AuctionCancelled']['nftAddress'] == erc1155_collection_mock.address
-    assert tx.events['ERC1155AuctionCancelled']['nftOwner'] == seller.address
-    assert tx.events['ERC1155AuctionCancelled']['tokenId'] == AuctionParams.token_id
-    assert tx.events['ERC1155AuctionCancelled']['auctionId'] == AuctionParams.auction_id
-
-    assert tx.events['ERC1155BidRefunded'] is not None
-    assert tx.events['ERC1155BidRefunded']['nftAddress'] == erc1155_collection_mock.address
-    assert tx.events['ERC1155BidRefunded']['nftOwner'] == seller.address
-    assert tx.events['ERC1155BidRefunded']['tokenId'] == AuctionParams.token_id
-    assert tx.events['ERC1155BidRefunded']['auctionId'] == AuctionParams.auction_id
-    assert tx.events['ERC1155BidRefunded']['bidder'] == bidder.address
-    assert tx.events['ERC1155BidRefunded']['bid'] == HighestBidParams.bid_amount
+    assert_event(
+        tx,
+        'ERC1155AuctionCancelled',
+        nftAddress=erc1155_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=AuctionParams.token_id,
+        auctionId=AuctionParams.auction_id
+    )
+
+    assert_event(
+        tx,
+        'ERC1155BidRefunded',
+        nftAddress=erc1155_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=AuctionParams.token_id,
+        auctionId=AuctionParams.auction_id,
+        bidder=bidder.address,
+        bid=HighestBidParams.bid_amount
+    )
 
     # assert auction does not exist
     assert erc1155_marketplace_mock.hasAuction(
@@ -647,13 +672,16 @@ def test_withdraw_bid(
     assert payment_token.balanceOf(erc1155_marketplace_mock) == initial_marketplace_amount - HighestBidParams.bid_amount
 
     # assert event emitted
-    assert tx.events['ERC1155BidWithdrawn'] is not None
-    assert tx.events['ERC1155BidWithdrawn']['nftAddress'] == erc1155_collection_mock.address
-    assert tx.events['ERC1155BidWithdrawn']['nftOwner'] == seller.address
-    assert tx.events['ERC1155BidWithdrawn']['tokenId'] == AuctionParams.token_id
-    assert tx.events['ERC1155BidWithdrawn']['auctionId'] == AuctionParams.auction_id
-    assert tx.events['ERC1155BidWithdrawn']['bidder'] == bidder.address
-    assert tx.events['ERC1155BidWithdrawn']['bid'] == HighestBidParams.bid_amount
+    assert_event(
+        tx,
+        'ERC1155BidWithdrawn',
+        nftAddress=erc1155_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=AuctionParams.token_id,
+        auctionId=AuctionParams.auction_id,
+        bidder=bidder.address,
+        bid=HighestBidParams.bid_amount
+    )
 
     # assert bid does not exist
     assert erc1155_marketplace_mock.hasHighestBid(
@@ -753,15 +781,18 @@ def test_finish_auction(
            initial_marketplace_token_amount - AuctionParams.token_amount
 
     # assert event emitted
-    assert tx.events['ERC1155AuctionFinished'] is not None
-    assert tx.events['ERC1155AuctionFinished']['oldOwner'] == seller.address
-    assert tx.events['ERC1155AuctionFinished']['nftAddress'] == erc1155_collection_mock.address
-    assert tx.events['ERC1155AuctionFinished']['tokenId'] == AuctionParams.token_id
-    assert tx.events['ERC1155AuctionFinished']['auctionId'] == AuctionParams.auction_id
-    assert tx.events['ERC1155AuctionFinished']['winner'] == bidder.address
-    assert tx.events['ERC1155AuctionFinished']['payToken'] == payment_token.address
-    assert tx.events['ERC1155AuctionFinished']['tokenAmount'] == AuctionParams.token_amount
-    assert tx.events['ERC1155AuctionFinished']['winningBid'] == price
+    assert_event(
+        tx,
+        'ERC1155AuctionFinished',
+        oldOwner=seller.address,
+        nftAddress=erc1155_collection_mock.address,
+        tokenId=AuctionParams.token_id,
+        auctionId=AuctionParams.auction_id,
+        winner=bidder.address,
+        payToken=payment_token.address,
+        tokenAmount=AuctionParams.token_amount,
+        winningBid=price
+    )
 
     # assert auction does not exist
     assert erc1155_marketplace_mock.hasAuction(
@@ -926,12 +957,15 @@ def test_update_auction_reserve_price(
     assert auction.reserve_price == reserve_price
 
     # assert event emitted
-    assert tx.events['ERC1155AuctionReservePriceUpdated'] is not None
-    assert tx.events['ERC1155AuctionReservePriceUpdated']['nftAddress'] == erc1155_collection_mock.address
-    assert tx.events['ERC1155AuctionReservePriceUpdated']['tokenId'] == AuctionParams.token_id
-    assert tx.events['ERC1155AuctionReservePriceUpdated']['auctionId'] == AuctionParams.auction_id
-    assert tx.events['ERC1155AuctionReservePriceUpdated']['owner'] == seller.address
-    assert tx.events['ERC1155AuctionReservePriceUpdated']['reservePrice'] == reserve_price
+    assert_event(
+        tx,
+        'ERC1155AuctionReservePriceUpdated',
+        nftAddress=erc1155_collection_mock.address,
+        tokenId=AuctionParams.token_id,
+        auctionId=AuctionParams.auction_id,
+        owner=seller.address,
+        reservePrice=reserve_price
+    )
 
 
 def test_update_auction_reserve_price_auction_not_exist(
@@ -7,7 +7,7 @@ from brownie.network.account import LocalAccount
 from typing import Callable
 from utils.structs import ERC1155Listing, Listing
 from utils.constants import TOMB_TOKEN
-from utils.helpers import calculate_listing_fee, calculate_royalty_fee
+from utils.helpers import calculate_listing_fee, calculate_royalty_fee, assert_event
 from brownie.test import given, strategy
 from hypothesis import settings
 
@@ -18,9 +18,13 @@ class ListingParams:
     token_amount: int = 50
     unit_size: int = 10
     unit_price: int = 100
-    start_time: int = chain.time() + (60 * 60)  # start listing at current time + 1 hour
     listing_id: int = 1
 
+    @classmethod
+    def start_time(cls) -> int:
+        # start listing at current time + 1 hour
+        return chain.time() + (60 * 60)
+
 
 @dataclass(frozen=True)
 class RoyaltyParams:
@@ -49,7 +53,7 @@ def royalty_recipient(user_3: LocalAccount) -> LocalAccount:
 
 def handle_listing_status(status: ListingStatus) -> None:
     if status is ListingStatus.STARTED:
-        chain.sleep(ListingParams.start_time - chain.time())
+        chain.sleep(ListingParams.start_time() - chain.time())
         chain.mine()
 
 
@@ -83,7 +87,7 @@ def setup_listing(
             ListingParams.unit_size,
             ListingParams.unit_price,
             ListingParams.listing_id,
-            ListingParams.start_time
+            ListingParams.start_time()
         )
         # start listing if required
         handle_listing_status(status)
@@ -137,16 +141,19 @@ def test_create_listing(
     assert erc1155_collection_mock.balanceOf(erc1155_marketplace_mock, token_id) == token_amount
 
     # asset event emitted correctly
-    assert tx.events['ERC1155ListingCreated'] is not None
-    assert tx.events['ERC1155ListingCreated']['owner'] == seller.address
-    assert tx.events['ERC1155ListingCreated']['nft'] == erc1155_collection_mock.address
-    assert tx.events['ERC1155ListingCreated']['tokenId'] == token_id
-    assert tx.events['ERC1155ListingCreated']['tokenAmount'] == token_amount
-    assert tx.events['ERC1155ListingCreated']['unitSize'] == unit_size
-    assert tx.events['ERC1155ListingCreated']['unitPrice'] == unit_price
-    assert tx.events['ERC1155ListingCreated']['listingId'] == listing_id
-    assert tx.events['ERC1155ListingCreated']['paymentToken'] == payment_token.address
-    assert tx.events['ERC1155ListingCreated']['startingTime'] == start_time
+    assert_event(
+        tx,
+        'ERC1155ListingCreated',
+        owner=seller.address,
+        nft=erc1155_collection_mock.address,
+        tokenId=token_id,
+        tokenAmount=token_amount,
+        unitSize=unit_size,
+        unitPrice=unit_price,
+        listingId=listing_id,
+        paymentToken=payment_token.address,
+        startingTime=start_time
+    )
 
 
 def test_create_listing_invalid_token_type(
@@ -167,7 +174,7 @@ def test_create_listing_invalid_token_type(
             1,
             ListingParams.unit_price,
             ListingParams.listing_id,
-            ListingParams.start_time,
+            ListingParams.start_time(),
             {'from': seller}
         )
 
@@ -215,7 +222,7 @@ def test_create_listing_payment_token_not_enabled(
             ListingParams.unit_size,
             ListingParams.unit_price,
             ListingParams.listing_id,
-            ListingParams.start_time,
+            ListingParams.start_time(),
             {'from': seller}
         )
 
@@ -238,7 +245,7 @@ def test_create_listing_already_exists(
             ListingParams.unit_size,
             ListingParams.unit_price,
             ListingParams.listing_id,
-            ListingParams.start_time,
+            ListingParams.start_time(),
             {'from': seller}
         )
 
@@ -261,7 +268,7 @@ def test_create_listing_invalid_amount(
             3,
             ListingParams.unit_price,
             ListingParams.listing_id,
-            ListingParams.start_time,
+            ListingParams.start_time(),
             {'from': seller}
         )
 
@@ -297,13 +304,16 @@ def test_update_listing(
     assert listing.listing.payment_token == TOMB_TOKEN
 
     # check event
-    assert tx.events["ERC1155ListingUpdated"] is not None
-    assert tx.events["ERC1155ListingUpdated"]["owner"] == seller.address
-    assert tx.events["ERC1155ListingUpdated"]["nft"] == erc1155_collection_mock.address
-    assert tx.events["ERC1155ListingUpdated"]["tokenId"] == ListingParams.token_id
-    assert tx.events["ERC1155ListingUpdated"]["listingId"] == ListingParams.listing_id
-    assert tx.events["ERC1155ListingUpdated"]["newPaymentToken"] == TOMB_TOKEN
-    assert tx.events["ERC1155ListingUpdated"]["newPrice"] == updated_listing_price
+    assert_event(
+        tx,
+        "ERC1155ListingUpdated",
+        owner=seller.address,
+        nft=erc1155_collection_mock.address,
+        tokenId=ListingParams.token_id,
+        listingId=ListingParams.listing_id,
+        newPaymentToken=TOMB_TOKEN,
+        newPrice=updated_listing_price
+    )
 
 
 def test_update_listing_not_exists(
@@ -381,11 +391,14 @@ def test_cancel_listing(
     ) is False
 
     # check event
-    assert tx.events["ERC1155ListingCanceled"] is not None
-    assert tx.events["ERC1155ListingCanceled"]["owner"] == seller.address
-    assert tx.events["ERC1155ListingCanceled"]["nft"] == erc1155_collection_mock.address
-    assert tx.events["ERC1155ListingCanceled"]["tokenId"] == ListingParams.token_id
-    assert tx.events["ERC1155ListingCanceled"]["listingId"] == ListingParams.listing_id
+    assert_event(
+        tx,
+        "ERC1155ListingCanceled",
+        owner=seller.address,
+        nft=erc1155_collection_mock.address,
+        tokenId=ListingParams.token_id,
+        listingId=ListingParams.listing_id
+    )
 
 
 def test_cancel_listing_not_exists(
@@ -457,15 +470,18 @@ def test_buy_listed_nft(
            initial_marketplace_token_amount - ListingParams.token_amount
 
     # check event
-    assert tx.events["ERC1155ListedItemSold"] is not None
-    assert tx.events["ERC1155ListedItemSold"]["seller"] == seller.address
-    assert tx.events["ERC1155ListedItemSold"]["buyer"] == buyer.address
-    assert tx.events["ERC1155ListedItemSold"]["nft"] == erc1155_collection_mock.address
-    assert tx.events["ERC1155ListedItemSold"]["tokenId"] == ListingParams.token_id
-    assert tx.events["ERC1155ListedItemSold"]["amount"] == ListingParams.token_amount
-    assert tx.events["ERC1155ListedItemSold"]["remainingAmount"] == 0
-    assert tx.events["ERC1155ListedItemSold"]["price"] == price
-    assert tx.events["ERC1155ListedItemSold"]["paymentToken"] == payment_token.address
+    assert_event(
+        tx,
+        "ERC1155ListedItemSold",
+        seller=seller.address,
+        buyer=buyer.address,
+        nft=erc1155_collection_mock.address,
+        tokenId=ListingParams.token_id,
+        amount=ListingParams.token_amount,
+        remainingAmount=0,
+        price=price,
+        paymentToken=payment_token.address
+    )
 
     # validate listing successfully deleted
     assert erc1155_marketplace_mock.hasListing(
@@ -510,10 +526,13 @@ def test_buy_listed_nft_partially(
     assert listing.remaining_token_amount == ListingParams.token_amount - token_amount
 
     # check event
-    assert tx.events["ERC1155ListedItemSold"] is not None
-    assert tx.events["ERC1155ListedItemSold"]["amount"] == token_amount
-    assert tx.events["ERC1155ListedItemSold"]["remainingAmount"] == ListingParams.token_amount - token_amount
-    assert tx.events["ERC1155ListedItemSold"]["price"] == price
+    assert_event(
+        tx,
+        "ERC1155ListedItemSold",
+        amount=token_amount,
+        remainingAmount=ListingParams.token_amount - token_amount,
+        price=price
+    )
 
 
 def test_buy_listed_nft_by_units(
@@ -545,10 +564,13 @@ def test_buy_listed_nft_by_units(
 
         remaining_amount -= ListingParams.unit_size
 
-        assert tx.events["ERC1155ListedItemSold"] is not None
-        assert tx.events["ERC1155ListedItemSold"]["amount"] == ListingParams.unit_size
-        assert tx.events["ERC1155ListedItemSold"]["remainingAmount"] == remaining_amount
-        assert tx.events["ERC1155ListedItemSold"]["price"] == ListingParams.unit_price
+        assert_event(
+            tx,
+            "ERC1155ListedItemSold",
+            amount=ListingParams.unit_size,
+            remainingAmount=remaining_amount,
+            price=ListingParams.unit_price
+        )
 
     # validate listing successfully deleted
     assert erc1155_marketplace_mock.hasListing(
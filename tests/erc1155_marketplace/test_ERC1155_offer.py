@@ -6,7 +6,7 @@ from brownie.network.contract import ProjectContract
 from brownie.network.account import LocalAccount
 from typing import Callable
 from utils.structs import ERC1155Offer, Offer
-from utils.helpers import calculate_offer_fee, calculate_royalty_fee
+from utils.helpers import calculate_offer_fee, calculate_royalty_fee, assert_event
 from brownie.test import given, strategy
 from hypothesis import settings
 
@@ -144,15 +144,18 @@ def test_create_offer(
     assert erc1155_offer.token_amount == token_amount
 
     # check event
-    assert tx.events["ERC1155OfferCreated"] is not None
-    assert tx.events["ERC1155OfferCreated"]["offeror"] == offeror.address
-    assert tx.events["ERC1155OfferCreated"]["nftAddress"] == erc1155_collection_mock.address
-    assert tx.events["ERC1155OfferCreated"]["tokenId"] == token_id
-    assert tx.events["ERC1155OfferCreated"]["tokenAmount"] == token_amount
-    assert tx.events["ERC1155OfferCreated"]["paymentToken"] == payment_token.address
-    assert tx.events["ERC1155OfferCreated"]["price"] == price
-    assert tx.events["ERC1155OfferCreated"]["expirationTime"] == expiration_time
-    assert tx.events["ERC1155OfferCreated"]["isPayTokenInEscrow"] == escrow_tokens
+    assert_event(
+        tx,
+        "ERC1155OfferCreated",
+        offeror=offeror.address,
+        nftAddress=erc1155_collection_mock.address,
+        tokenId=token_id,
+        tokenAmount=token_amount,
+        paymentToken=payment_token.address,
+        price=price,
+        expirationTime=expiration_time,
+        isPayTokenInEscrow=escrow_tokens
+    )
 
     # assert tokens transferred
     if escrow_tokens:
@@ -288,11 +291,14 @@ def test_cancel_offer(
     assert erc1155_marketplace_mock.hasOffer(erc1155_collection_mock, OfferParams.token_id, offeror) is False
 
     # check event
-    assert tx.events["ERC1155OfferCanceled"] is not None
-    assert tx.events["ERC1155OfferCanceled"]["offeror"] == offeror.address
-    assert tx.events["ERC1155OfferCanceled"]["nftAddress"] == erc1155_collection_mock.address
-    assert tx.events["ERC1155OfferCanceled"]["tokenId"] == OfferParams.token_id
-    assert tx.events["ERC1155OfferCanceled"]["tokenAmount"] == OfferParams.token_amount
+    assert_event(
+        tx,
+        "ERC1155OfferCanceled",
+        offeror=offeror.address,
+        nftAddress=erc1155_collection_mock.address,
+        tokenId=OfferParams.token_id,
+        tokenAmount=OfferParams.token_amount
+    )
 
     # assert tokens refunded
     if escrow_tokens:
@@ -358,14 +364,17 @@ def test_accept_offer(
     assert erc1155_marketplace_mock.hasOffer(erc1155_collection_mock, OfferParams.token_id, offeror) is False
 
     # check event
-    assert tx.events["ERC1155OfferAccepted"] is not None
-    assert tx.events["ERC1155OfferAccepted"]["seller"] == token_owner.address
-    assert tx.events["ERC1155OfferAccepted"]["buyer"] == offeror.address
-    assert tx.events["ERC1155OfferAccepted"]["nftAddress"] == erc1155_collection_mock.address
-    assert tx.events["ERC1155OfferAccepted"]["tokenId"] == OfferParams.token_id
-    assert tx.events["ERC1155OfferAccepted"]["tokenAmount"] == OfferParams.token_amount
-    assert tx.events["ERC1155OfferAccepted"]["price"] == OfferParams.price
-    assert tx.events["ERC1155OfferAccepted"]["paymentToken"] == payment_token.address
+    assert_event(
+        tx,
+        "ERC1155OfferAccepted",
+        seller=token_owner.address,
+        buyer=offeror.address,
+        nftAddress=erc1155_collection_mock.address,
+        tokenId=OfferParams.token_id,
+        tokenAmount=OfferParams.token_amount,
+        price=OfferParams.price,
+        paymentToken=payment_token.address
+    )
 
     # assert tokens transferred
     assert erc1155_collection_mock.balanceOf(offeror, OfferParams.token_id) == \
@@ -6,7 +6,8 @@ from brownie.network.account import LocalAccount
 from typing import Callable
 from brownie import reverts, chain, accounts, ZERO_ADDRESS
 from brownie.test import given, strategy
-from utils.helpers import calculate_auction_fee, calculate_royalty_fee
+from hypothesis import settings
+from utils.helpers import calculate_auction_fee, calculate_royalty_fee, assert_event
 from utils.structs import Auction, HighestBid
 
 
@@ -16,8 +17,16 @@ class AuctionParams:
     token_uri: str = 'mock-uri'
     token_amount: int = 10
     reserve_price: int = 50
-    start_time: int = chain.time() + (60 * 30)  # start auction at current time + 30 minutes
-    end_time: int = start_time + (60 * 60 * 2)  # end auction in 2 hours from start
+    duration: int = 60 * 60 * 2  # end auction in 2 hours from start
+
+    @classmethod
+    def start_time(cls) -> int:
+        # start auction at current time + 30 minutes
+        return chain.time() + (60 * 30)
+
+    @classmethod
+    def end_time(cls) -> int:
+        return cls.start_time() + cls.duration
 
 
 @dataclass(frozen=True)
@@ -59,7 +68,7 @@ def royalty_recipient(user_4: LocalAccount) -> LocalAccount:
 def handle_auction_status(status: AuctionStatus) -> None:
     if status is not AuctionStatus.NOT_STARTED:
         chain.sleep(
-            (AuctionParams.end_time if status is AuctionStatus.ENDED else AuctionParams.start_time) - chain.time()
+            (AuctionParams.end_time() if status is AuctionStatus.ENDED else AuctionParams.start_time()) - chain.time()
         )
         chain.mine()
 
@@ -90,8 +99,8 @@ def setup_auction(
             seller,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.end_time,
+            AuctionParams.start_time(),
+            AuctionParams.end_time(),
             is_min_bid_reserve_price
         )
         # start/end auction
@@ -163,11 +172,14 @@ def test_create_auction(
     assert erc721_collection_mock.ownerOf(token_id) == erc721_marketplace_mock
 
     # asset event emitted correctly
-    assert tx.events['ERC721AuctionCreated'] is not None
-    assert tx.events['ERC721AuctionCreated']['nftAddress'] == erc721_collection_mock.address
-    assert tx.events['ERC721AuctionCreated']['tokenId'] == token_id
-    assert tx.events['ERC721AuctionCreated']['owner'] == seller.address
-    assert tx.events['ERC721AuctionCreated']['payToken'] == payment_token.address
+    assert_event(
+        tx,
+        'ERC721AuctionCreated',
+        nftAddress=erc721_collection_mock.address,
+        tokenId=token_id,
+        owner=seller.address,
+        payToken=payment_token.address
+    )
 
     # assert auction created
     auction = Auction(*erc721_marketplace_mock.getAuction(erc721_collection_mock, token_id))
@@ -195,14 +207,15 @@ def test_create_auction_invalid_token_type(
             token_id,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.end_time,
+            AuctionParams.start_time(),
+            AuctionParams.end_time(),
             False,
             {'from': seller}
         )
 
 
 @given(token_address=strategy('address'))
+@settings(max_examples=1)
 def test_create_auction_invalid_payment_token(
         erc721_marketplace_mock: ProjectContract,
         erc721_collection_mock: ProjectContract,
@@ -218,8 +231,8 @@ def test_create_auction_invalid_payment_token(
             token_id,
             token_address,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.end_time,
+            AuctionParams.start_time(),
+            AuctionParams.end_time(),
             False,
             {'from': seller}
         )
@@ -234,14 +247,15 @@ def test_create_auction_invalid_time_maximum_duration(
 ) -> None:
     """Test auction creation with invalid time - maximum duration"""
     token_id = erc721_collection_mint_with_approval(seller)
+    start_time = AuctionParams.start_time()
     with reverts('MarketplaceBase: Auction time exceeds maximum duration'):
         erc721_marketplace_mock.createAuction(
             erc721_collection_mock,
             token_id,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.start_time + (erc721_marketplace_mock.getMaximumAuctionDuration() + 1),
+            start_time,
+            start_time + (erc721_marketplace_mock.getMaximumAuctionDuration() + 1),
             False,
             {'from': seller}
         )
@@ -256,14 +270,15 @@ def test_create_auction_invalid_time_minimum_duration(
 ) -> None:
     """Test auction creation with invalid time - minimum duration"""
     token_id = erc721_collection_mint_with_approval(seller)
+    start_time = AuctionParams.start_time()
     with reverts('MarketplaceBase: Auction time does not meet minimum duration'):
         erc721_marketplace_mock.createAuction(
             erc721_collection_mock,
             token_id,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.start_time + (erc721_marketplace_mock.getMinimumAuctionDuration() - 1),
+            start_time,
+            start_time + (erc721_marketplace_mock.getMinimumAuctionDuration() - 1),
             False,
             {'from': seller}
         )
@@ -284,8 +299,8 @@ def test_create_auction_already_exists(
             token_id,
             payment_token,
             AuctionParams.reserve_price,
-            AuctionParams.start_time,
-            AuctionParams.end_time,
+            AuctionParams.start_time(),
+            AuctionParams.end_time(),
             False,
             {'from': seller}
         )
@@ -321,12 +336,15 @@ def test_place_bid(
     assert highest_bid.bidder == bidder.address
 
     # asset event emitted correctly
-    assert tx.events['ERC721BidPlaced'] is not None
-    assert tx.events['ERC721BidPlaced']['nftAddress'] == erc721_collection_mock.address
-    assert tx.events['ERC721BidPlaced']['nftOwner'] == seller.address
-    assert tx.events['ERC721BidPlaced']['tokenId'] == token_id
-    assert tx.events['ERC721BidPlaced']['bidder'] == bidder.address
-    assert tx.events['ERC721BidPlaced']['bid'] == bid_amount
+    assert_event(
+        tx,
+        'ERC721BidPlaced',
+        nftAddress=erc721_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=token_id,
+        bidder=bidder.address,
+        bid=bid_amount
+    )
 
     # assert tokens transferred
     assert payment_token.balanceOf(bidder) == initial_bidder_balance - bid_amount
@@ -440,12 +458,15 @@ def test_place_bid_outbid_highest_bid(
            == initial_marketplace_balance - HighestBidParams.bid_amount + bid_amount
 
     # asset event emitted correctly
-    assert tx.events['ERC721BidRefunded'] is not None
-    assert tx.events['ERC721BidRefunded']['nftAddress'] == erc721_collection_mock.address
-    assert tx.events['ERC721BidRefunded']['nftOwner'] == seller.address
-    assert tx.events['ERC721BidRefunded']['tokenId'] == token_id
-    assert tx.events['ERC721BidRefunded']['bidder'] == bidder.address
-    assert tx.events['ERC721BidRefunded']['bid'] == HighestBidParams.bid_amount
+    assert_event(
+        tx,
+        'ERC721BidRefunded',
+        nftAddress=erc721_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=token_id,
+        bidder=bidder.address,
+        bid=HighestBidParams.bid_amount
+    )
 
 
 def test_place_bid_below_previous_highest_bid(
@@ -519,17 +540,23 @@ def test_cancel_auction(
     assert erc721_collection_mock.ownerOf(token_id) == seller
 
     # asset events emitted correctly
-    assert tx.events['ERC721AuctionCancelled'] is not None
-    assert tx.events['ERC721AuctionCancelled']['nftAddress'] == erc721_collection_mock.address
-    assert tx.events['ERC721AuctionCancelled']['nftOwner'] == seller.address
-    assert tx.events['ERC721AuctionCancelled']['tokenId'] == token_id
-
-    assert tx.events['ERC721BidRefunded'] is not None
-    assert tx.events['ERC721BidRefunded']['nftAddress'] == erc721_collection_mock.address
-    assert tx.events['ERC721BidRefunded']['nftOwner'] == seller.address
-    assert tx.events['ERC721BidRefunded']['tokenId'] == token_id
-    assert tx.events['ERC721BidRefunded']['bidder'] == bidder.address
-    assert tx.events['ERC721BidRefunded']['bid'] == HighestBidParams.bid_amount
+    assert_event(
+        tx,
+        'ERC721AuctionCancelled',
+        nftAddress=erc721_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=token_id
+    )
+
+    assert_event(
+        tx,
+        'ERC721BidRefunded',
+        nftAddress=erc721_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=token_id,
+        bidder=bidder.address,
+        bid=HighestBidParams.bid_amount
+    )
 
     # assert auction does not exist
     assert erc721_marketplace_mock.hasAuction(erc721_collection_mock, token_id) is False
@@ -603,12 +630,15 @@ def test_withdraw_bid(
     assert payment_token.balanceOf(erc721_marketplace_mock) == initial_marketplace_amount - HighestBidParams.bid_amount
 
     # assert event emitted
-    assert tx.events['ERC721BidWithdrawn'] is not None
-    assert tx.events['ERC721BidWithdrawn']['nftAddress'] == erc721_collection_mock.address
-    assert tx.events['ERC721BidWithdrawn']['nftOwner'] == seller.address
-    assert tx.events['ERC721BidWithdrawn']['tokenId'] == token_id
-    assert tx.events['ERC721BidWithdrawn']['bidder'] == bidder.address
-    assert tx.events['ERC721BidWithdrawn']['bid'] == HighestBidParams.bid_amount
+    assert_event(
+        tx,
+        'ERC721BidWithdrawn',
+        nftAddress=erc721_collection_mock.address,
+        nftOwner=seller.address,
+        tokenId=token_id,
+        bidder=bidder.address,
+        bid=HighestBidParams.bid_amount
+    )
 
     # assert bid does not exist
     assert erc721_marketplace_mock.hasHighestBid(erc721_collection_mock, token_id) is False
@@ -698,13 +728,16 @@ def test_finish_auction(
     assert erc721_collection_mock.ownerOf(token_id) == bidder
 
     # assert event emitted
-    assert tx.events['ERC721AuctionFinished'] is not None
-    assert tx.events['ERC721AuctionFinished']['oldOwner'] == seller.address
-    assert tx.events['ERC721AuctionFinished']['nftAddress'] == erc721_collection_mock.address
-    assert tx.events['ERC721AuctionFinished']['tokenId'] == token_id
-    assert tx.events['ERC721AuctionFinished']['winner'] == bidder.address
-    assert tx.events['ERC721AuctionFinished']['payToken'] == payment_token.address
-    assert tx.events['ERC721AuctionFinished']['winningBid'] == price
+    assert_event(
+        tx,
+        'ERC721AuctionFinished',
+        oldOwner=seller.address,
+        nftAddress=erc721_collection_mock.address,
+        tokenId=token_id,
+        winner=bidder.address,
+        payToken=payment_token.address,
+        winningBid=price
+    )
 
     # assert auction does not exist
     assert erc721_marketplace_mock.hasAuction(erc721_collection_mock, token_id) is False
@@ -855,11 +888,14 @@ def test_update_auction_reserve_price(
     assert auction.reserve_price == reserve_price
 
     # assert event emitted
-    assert tx.events['ERC721AuctionReservePriceUpdated'] is not None
-    assert tx.events['ERC721AuctionReservePriceUpdated']['nftAddress'] == erc721_collection_mock.address
-    assert tx.events['ERC721AuctionReservePriceUpdated']['tokenId'] == token_id
-    assert tx.events['ERC721AuctionReservePriceUpdated']['owner'] == seller.address
-    assert tx.events['ERC721AuctionReservePriceUpdated']['reservePrice'] == reserve_price
+    assert_event(
+        tx,
+        'ERC721AuctionReservePriceUpdated',
+        nftAddress=erc721_collection_mock.address,
+        tokenId=token_id,
+        owner=seller.address,
+        reservePrice=reserve_price
+    )
 
 
 def test_update_auction_reserve_price_auction_not_exist(
@@ -1,11 +1,10 @@
 import pytest
-import math
 from enum import Enum
 from dataclasses import dataclass
 from brownie.network.contract import ProjectContract
 from brownie.network.account import LocalAccount
 from typing import Callable
-from utils.helpers import calculate_offer_fee, calculate_royalty_fee
+from utils.helpers import calculate_offer_fee, calculate_royalty_fee, assert_event
 from brownie import reverts, Wei, chain, ZERO_ADDRESS
 from utils.constants import WFTM_TOKEN, TOMB_TOKEN, ZOO_TOKEN
 from utils.structs import Listing
@@ -15,7 +14,11 @@ from utils.structs import Listing
 class ListingParams:
     price: int = 100
     unit_price: int = 100
-    start_time: int = chain.time() + (60 * 60)  # start listing at current time + 1 hour
+
+    @classmethod
+    def start_time(cls) -> int:
+        # start listing at current time + 1 hour
+        return chain.time() + (60 * 60)
 
 
 @dataclass(frozen=True)
@@ -45,7 +48,7 @@ def royalty_recipient(user_3: LocalAccount) -> LocalAccount:
 
 def handle_listing_status(status: ListingStatus) -> None:
     if status is ListingStatus.STARTED:
-        chain.sleep(ListingParams.start_time - chain.time())
+        chain.sleep(ListingParams.start_time() - chain.time())
         chain.mine()
 
 
@@ -73,7 +76,7 @@ def setup_listing(
             token_id,
             payment_token,
             ListingParams.price,
-            ListingParams.start_time,
+            ListingParams.start_time(),
             {'from': seller}
         )
 
@@ -93,6 +96,7 @@ def test_create_listing(
 ) -> None:
     """Test listing creation"""
     token_id = erc721_collection_mint_with_approval(seller)
+    start_time = ListingParams.start_time()
 
     # create listing
     tx = erc721_marketplace_mock.createListing(
@@ -100,7 +104,7 @@ def test_create_listing(
         token_id,
         payment_token,
         ListingParams.price,
-        ListingParams.start_time,
+        start_time,
         {'from': seller}
     )
 
@@ -113,16 +117,19 @@ def test_create_listing(
     assert listing.owner == seller
     assert listing.payment_token == payment_token.address
     assert listing.price == ListingParams.price
-    assert listing.starting_time == ListingParams.start_time
+    assert listing.starting_time == start_time
 
     # check event
-    assert tx.events["ERC721ListingCreated"] is not None
-    assert tx.events["ERC721ListingCreated"]["nftOwner"] == seller
-    assert tx.events["ERC721ListingCreated"]["nftAddress"] == erc721_collection_mock
-    assert tx.events["ERC721ListingCreated"]["tokenId"] == token_id
-    assert tx.events["ERC721ListingCreated"]["paymentToken"] == payment_token.address
-    assert tx.events["ERC721ListingCreated"]["price"] == ListingParams.price
-    assert tx.events["ERC721ListingCreated"]["startingTime"] == ListingParams.start_time
+    assert_event(
+        tx,
+        "ERC721ListingCreated",
+        nftOwner=seller,
+        nftAddress=erc721_collection_mock,
+        tokenId=token_id,
+        paymentToken=payment_token.address,
+        price=ListingParams.price,
+        startingTime=start_time
+    )
 
 
 def test_list_already_listed_token(
@@ -143,7 +150,7 @@ def test_list_already_listed_token(
             token_id,
             payment_token,
             ListingParams.price,
-            ListingParams.start_time,
+            ListingParams.start_time(),
             {'from': seller}
         )
 
@@ -163,7 +170,7 @@ def test_listing_not_erc721(
             token_id,
             payment_token,
             ListingParams.price,
-            ListingParams.start_time,
+            ListingParams.start_time(),
             {'from': seller}
         )
 
@@ -217,12 +224,15 @@ def test_update_listing(
     assert listing.price == updated_listing_price
 
     # check event
-    assert tx.events["ERC721ListingUpdated"] is not None
-    assert tx.events["ERC721ListingUpdated"]["nftOwner"] == seller
-    assert tx.events["ERC721ListingUpdated"]["nftAddress"] == erc721_collection_mock
-    assert tx.events["ERC721ListingUpdated"]["tokenId"] == token_id
-    assert tx.events["ERC721ListingUpdated"]["newPaymentToken"] == new_payment_token
-    assert tx.events["ERC721ListingUpdated"]["newPrice"] == updated_listing_price
+    assert_event(
+        tx,
+        "ERC721ListingUpdated",
+        nftOwner=seller,
+        nftAddress=erc721_collection_mock,
+        tokenId=token_id,
+        newPaymentToken=new_payment_token,
+        newPrice=updated_listing_price
+    )
 
 
 def test_update_listing_as_not_owner(
@@ -289,10 +299,13 @@ def test_cancel_listing(
     assert erc721_marketplace_mock.hasListing(erc721_collection_mock, token_id) is False
 
     # check event
-    assert tx.events["ERC721ListingCanceled"] is not None
-    assert tx.events["ERC721ListingCanceled"]["nftOwner"] == seller
-    assert tx.events["ERC721ListingCanceled"]["nftAddress"] == erc721_collection_mock
-    assert tx.events["ERC721ListingCanceled"]["tokenId"] == token_id
+    assert_event(
+        tx,
+        "ERC721ListingCanceled",
+        nftOwner=seller,
+        nftAddress=erc721_collection_mock,
+        tokenId=token_id
+    )
 
 
 def test_cancel_listing_as_not_owner(
@@ -376,13 +389,16 @@ def test_buy_listed_nft(
     assert erc721_collection_mock.ownerOf(token_id) == buyer
 
     # check event
-    assert tx.events["ERC721ListedItemSold"] is not None
-    assert tx.events["ERC721ListedItemSold"]["seller"] == seller
-    assert tx.events["ERC721ListedItemSold"]["buyer"] == buyer
-    assert tx.events["ERC721ListedItemSold"]["nftAddress"] == erc721_collection_mock
-    assert tx.events["ERC721ListedItemSold"]["tokenId"] == token_id
-    assert tx.events["ERC721ListedItemSold"]["price"] == ListingParams.price
-    assert tx.events["ERC721ListedItemSold"]["paymentToken"] == payment_token
+    assert_event(
+        tx,
+        "ERC721ListedItemSold",
+        seller=seller,
+        buyer=buyer,
+        nftAddress=erc721_collection_mock,
+        tokenId=token_id,
+        price=ListingParams.price,
+        paymentToken=payment_token
+    )
 
     # check Listing removal
     assert erc721_marketplace_mock.hasListing(erc721_collection_mock, token_id) is False
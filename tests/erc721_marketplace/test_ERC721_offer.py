@@ -1,5 +1,3 @@
-import math
-
 import pytest
 from enum import Enum
 from dataclasses import dataclass
@@ -7,7 +5,7 @@ from brownie.network.contract import ProjectContract
 from brownie.network.account import LocalAccount
 from typing import Callable
 from utils.structs import Offer
-from utils.helpers import calculate_offer_fee, calculate_royalty_fee
+from utils.helpers import calculate_offer_fee, calculate_royalty_fee, assert_event
 from brownie import reverts, Wei, chain, ZERO_ADDRESS
 
 
@@ -125,14 +123,17 @@ def test_create_offer_escrow(
     assert offer.payment_token_in_escrow == escrow_tokens
 
     # check event
-    assert tx.events["ERC721OfferCreated"] is not None
-    assert tx.events["ERC721OfferCreated"]["offeror"] == offeror
-    assert tx.events["ERC721OfferCreated"]["nftAddress"] == erc721_collection_mock
-    assert tx.events["ERC721OfferCreated"]["tokenId"] == token_id
-    assert tx.events["ERC721OfferCreated"]["paymentToken"] == payment_token.address
-    assert tx.events["ERC721OfferCreated"]["price"] == OfferParams.price
-    assert tx.events["ERC721OfferCreated"]["expirationTime"] == OfferParams.expiration_time
-    assert tx.events["ERC721OfferCreated"]["isPayTokenInEscrow"] == escrow_tokens
+    assert_event(
+        tx,
+        "ERC721OfferCreated",
+        offeror=offeror,
+        nftAddress=erc721_collection_mock,
+        tokenId=token_id,
+        paymentToken=payment_token.address,
+        price=OfferParams.price,
+        expirationTime=OfferParams.expiration_time,
+        isPayTokenInEscrow=escrow_tokens
+    )
 
     # assert tokens transferred
     if escrow_tokens:
@@ -283,10 +284,13 @@ def test_cancel_offer(
     assert erc721_marketplace_mock.hasOffer(erc721_collection_mock, token_id, offeror) is False
 
     # check event
-    assert tx.events["ERC721OfferCanceled"] is not None
-    assert tx.events["ERC721OfferCanceled"]["offeror"] == offeror
-    assert tx.events["ERC721OfferCanceled"]["nftAddress"] == erc721_collection_mock
-    assert tx.events["ERC721OfferCanceled"]["tokenId"] == token_id
+    assert_event(
+        tx,
+        "ERC721OfferCanceled",
+        offeror=offeror,
+        nftAddress=erc721_collection_mock,
+        tokenId=token_id
+    )
 
 
 @pytest.mark.parametrize(
@@ -393,13 +397,16 @@ def test_accept_offer(
     assert erc721_collection_mock.ownerOf(token_id) == offeror
 
     # check event
-    assert tx.events["ERC721OfferAccepted"] is not None
-    assert tx.events["ERC721OfferAccepted"]["seller"] == token_owner
-    assert tx.events["ERC721OfferAccepted"]["buyer"] == offeror
-    assert tx.events["ERC721OfferAccepted"]["nftAddress"] == erc721_collection_mock
-    assert tx.events["ERC721OfferAccepted"]["tokenId"] == token_id
-    assert tx.events["ERC721OfferAccepted"]["price"] == OfferParams.price
-    assert tx.events["ERC721OfferAccepted"]["paymentToken"] == payment_token
+    assert_event(
+        tx,
+        "ERC721OfferAccepted",
+        seller=token_owner,
+        buyer=offeror,
+        nftAddress=erc721_collection_mock,
+        tokenId=token_id,
+        price=OfferParams.price,
+        paymentToken=payment_token
+    )
 
     # check offer existence
     assert erc721_marketplace_mock.hasOffer(erc721_collection_mock, token_id, offeror) is False
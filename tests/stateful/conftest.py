@@ -0,0 +1,17 @@
+import pytest
+from brownie import chain
+from typing import Iterator
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolate() -> Iterator[None]:
+    # overrides the root isolate fixture for state machine tests
+    # state_machine() takes its own snapshot after the state machine __init__, replacing the one taken here in
+    # brownie's single snapshot slot, so the snapshot id is restored before reverting to undo changes made in __init__
+    # chain.reset() is not used, it would also wipe the session scoped deployments used by other modules
+    # relies on Chain._snapshot_id of brownie 1.18.1 (pinned in docker/brownie/Dockerfile), recheck when upgrading
+    chain.snapshot()
+    snapshot_id = chain._snapshot_id
+    yield
+    chain._snapshot_id = snapshot_id
+    chain.revert()
@@ -1,5 +1,6 @@
 from brownie import reverts
 from brownie.test import strategy
+import utils.constants
 
 
 class StateMachine:
@@ -37,4 +38,9 @@ class StateMachine:
 
 
 def test_stateful(owner, payment_token_registry, state_machine):
-    state_machine(StateMachine, owner, payment_token_registry)
+    state_machine(
+        StateMachine,
+        owner,
+        payment_token_registry,
+        settings={'phases': utils.constants.STATEFUL_PHASES}
+    )
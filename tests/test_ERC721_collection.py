@@ -1,9 +1,10 @@
 import pytest
-from brownie import reverts, Wei, ERC721CollectionMock, accounts
+from brownie import reverts, Wei, ERC721CollectionMock
 from utils.constants import COLLECTION_MINT_FEE, COLLECTION_NAME, COLLECTION_SYMBOL, COLLECTION_MINT_FEE
 from brownie.network.contract import ProjectContract
 from brownie.network.account import LocalAccount
 from typing import Callable
+from utils.helpers import assert_event
 
 
 @pytest.fixture(scope="module")
@@ -18,11 +19,14 @@ def erc721_collection_private_mock(owner: LocalAccount) -> ProjectContract:
     )
 
 
-def test_mint(erc721_collection_mock: ProjectContract, user: LocalAccount) -> None:
+def test_mint(
+        erc721_collection_mock: ProjectContract,
+        mint_fee_recipient: LocalAccount,
+        user: LocalAccount
+) -> None:
     """Test minting"""
     latest_token_id = erc721_collection_mock.getLatestTokenId()
-    fee_recipient = accounts.at(erc721_collection_mock.getMintFeeRecipient())
-    fee_recipient_initial_balance = fee_recipient.balance()
+    fee_recipient_initial_balance = mint_fee_recipient.balance()
 
     # mint token
     tx = erc721_collection_mock.mint(
@@ -36,10 +40,10 @@ def test_mint(erc721_collection_mock: ProjectContract, user: LocalAccount) -> No
     assert token_id == latest_token_id + 1
 
     # assert fee recipient received minting fee
-    assert fee_recipient.balance() == fee_recipient_initial_balance + COLLECTION_MINT_FEE
+    assert mint_fee_recipient.balance() == fee_recipient_initial_balance + COLLECTION_MINT_FEE
 
     # assert event has been emitted
-    assert tx.events['Minted'] is not None
+    assert_event(tx, 'Minted')
 
 
 def test_mint_insufficient_funds(erc721_collection_mock: ProjectContract, user: LocalAccount) -> None:
@@ -78,7 +82,7 @@ def test_burn(erc721_collection_mock: ProjectContract, erc721_collection_mint: C
     """Test burning"""
     token_id = erc721_collection_mint(user.address)
     tx = erc721_collection_mock.burn(token_id, {'from': user})
-    assert tx.events['Burned'] is not None
+    assert_event(tx, 'Burned')
 
 
 def test_burn_unauthorized(
@@ -185,7 +189,7 @@ def test_update_mint_fee(
     """Test update mint fee"""
     tx = erc721_collection_mock.updateMintFee(Wei('2 ether'), {'from': owner})
     assert erc721_collection_mock.getMintFee() == Wei('2 ether')
-    assert tx.events['UpdatedMintFee'] is not None
+    assert_event(tx, 'UpdatedMintFee')
 
 
 def test_update_mint_fee_unauthorized(
@@ -205,7 +209,7 @@ def test_update_mint_fee_recipient(
     """Test update mint fee recipient"""
     tx = erc721_collection_mock.updateMintFeeRecipient(user.address, {'from': owner})
     assert erc721_collection_mock.getMintFeeRecipient() == user.address
-    assert tx.events['UpdatedMintFeeRecipient'] is not None
+    assert_event(tx, 'UpdatedMintFeeRecipient')
 
 
 def test_update_mint_fee_recipient_unauthorized(
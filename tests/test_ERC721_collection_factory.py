@@ -1,60 +1,74 @@
-from brownie import Wei, accounts, reverts, ERC721Collection
+from brownie import Wei, reverts, ERC721Collection
 from brownie.network.contract import ProjectContract
+from brownie.network.account import LocalAccount
+from utils.helpers import assert_event
 
 
 class TestCreateERC721Collection:
-    create_collection_fee = Wei("5 ether")  # fee recipient is accounts[0]
+    create_collection_fee = Wei("5 ether")  # fee recipient is owner
 
-    def test_insufficient_funds(self, erc721_collection_factory: ProjectContract) -> None:
+    def test_insufficient_funds(self, erc721_collection_factory: ProjectContract, owner: LocalAccount) -> None:
         with reverts("ERC721CollectionFactory: Insufficient funds"):
             erc721_collection_factory.createERC721Collection(
                 "TestToken",
                 "TT",
                 Wei("2 ether"),
-                accounts[0],
+                owner,
                 False,
-                {"from": accounts[0], "value": 1}
+                {"from": owner, "value": 1}
             )
 
-    def test_transfer_platform_fee(self, erc721_collection_factory: ProjectContract) -> None:
-        fee_recipient_balance_before = accounts[0].balance()
+    def test_transfer_platform_fee(
+            self,
+            erc721_collection_factory: ProjectContract,
+            owner: LocalAccount,
+            user: LocalAccount
+    ) -> None:
+        fee_recipient_balance_before = owner.balance()
 
         erc721_collection_factory.createERC721Collection(
             "TestToken",
             "TT",
             Wei("2 ether"),
-            accounts[1],
+            user,
             False,
-            {"from": accounts[1], "value": self.create_collection_fee}
+            {"from": user, "value": self.create_collection_fee}
         )
 
-        assert accounts[0].balance() == fee_recipient_balance_before + self.create_collection_fee
+        assert owner.balance() == fee_recipient_balance_before + self.create_collection_fee
 
-    def test_creates_collection_and_set_owner(self, erc721_collection_factory: ProjectContract) -> None:
+    def test_creates_collection_and_set_owner(
+            self,
+            erc721_collection_factory: ProjectContract,
+            user: LocalAccount
+    ) -> None:
         tx = erc721_collection_factory.createERC721Collection(
             "TestToken",
             "TT",
             Wei("2 ether"),
-            accounts[1],
+            user,
             False,
-            {"from": accounts[1], "value": self.create_collection_fee}
+            {"from": user, "value": self.create_collection_fee}
         )
 
         collection = ERC721Collection.at(tx.return_value)
         assert collection is not None
         assert collection._name == "ERC721Collection"
-        assert collection.owner() == accounts[1]
+        assert collection.owner() == user
 
-    def test_emits_correct_event(self, erc721_collection_factory: ProjectContract) -> None:
+    def test_emits_correct_event(self, erc721_collection_factory: ProjectContract, user: LocalAccount) -> None:
         tx = erc721_collection_factory.createERC721Collection(
             "TestToken",
             "TT",
             Wei("2 ether"),
-            accounts[1],
+            user,
             False,
-            {"from": accounts[1], "value": self.create_collection_fee}
+            {"from": user, "value": self.create_collection_fee}
         )
 
-        assert tx.events["ERC721CollectionCreated"] is not None
-        assert tx.events["ERC721CollectionCreated"]["creator"] == accounts[1]
-        assert tx.events["ERC721CollectionCreated"]["nft"] == tx.return_value
+        assert_event(
+            tx,
+            "ERC721CollectionCreated",
+            creator=user,
+            nft=tx.return_value
+        )
@@ -0,0 +1,36 @@
+import pytest
+from typing import Iterator
+from utils.helpers import calculate_auction_fee, calculate_listing_fee, calculate_offer_fee, calculate_royalty_fee
+
+
+@pytest.fixture(autouse=True)
+def isolate() -> Iterator[None]:
+    # the helpers are pure functions, override the chain snapshot/revert isolation from conftest
+    yield
+
+
+@pytest.mark.parametrize('calculate_fee', [calculate_auction_fee, calculate_listing_fee, calculate_offer_fee])
+@pytest.mark.parametrize('price,percents,fee', [
+    (0, 25, 0),
+    (1_000, 25, 25),
+    (999, 25, 24),  # 24.975 is rounded down
+    (7, 1, 0),
+    (100, 1_000, 100),
+    (123_456_789_123_456_789_123, 3, 370_370_367_370_370_367),  # exceeds float precision
+])
+def test_marketplace_fee(calculate_fee, price: int, percents: int, fee: int) -> None:
+    """Test marketplace fee calculation"""
+    assert calculate_fee(price, percents) == fee
+
+
+@pytest.mark.parametrize('price,percents,fee', [
+    (0, 500, 0),
+    (10_000, 1_000, 1_000),
+    (9_999, 1_000, 999),  # 999.9 is rounded down
+    (1, 9_999, 0),
+    (100, 10_000, 100),
+    (123_456_789_123_456_789_123, 250, 3_086_419_728_086_419_728),
+])
+def test_royalty_fee(price: int, percents: int, fee: int) -> None:
+    """Test royalty fee calculation"""
+    assert calculate_royalty_fee(price, percents) == fee
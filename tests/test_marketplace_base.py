@@ -1,9 +1,20 @@
 import pytest
 from brownie import reverts, MarketplaceBaseMock
-from brownie.test import given, strategy
+from utils.constants import TEST_ADDRESSES
 from brownie.network.contract import ProjectContract
 from brownie.network.account import LocalAccount
-from typing import Callable
+from typing import Any
+
+# owner only setters with the getter and the value to set
+UPDATE_PARAMS = [
+    *[('updateAddressRegistryAddress', 'getAddressRegistryAddress', address) for address in TEST_ADDRESSES],
+    ('updateMinBidIncrementAmount', 'getMinBidIncrementAmount', 5),
+    ('updateAuctionFee', 'getAuctionFee', 5),
+    ('updateListingFee', 'getListingFee', 5),
+    ('updateOfferFee', 'getOfferFee', 5),
+    *[('updateFeeRecipient', 'getFeeRecipient', address) for address in TEST_ADDRESSES],
+    ('updateEscrowOfferPaymentTokens', 'getEscrowOfferPaymentTokens', True),
+]
 
 
 @pytest.fixture(scope="module")
@@ -13,116 +24,27 @@ def marketplace_base_mock(address_registry: ProjectContract, owner: LocalAccount
     return contract
 
 
-@given(address=strategy('address'))
-def test_update_address_registry_address(
+@pytest.mark.parametrize('setter,getter,value', UPDATE_PARAMS)
+def test_update(
         marketplace_base_mock: ProjectContract,
-        address: LocalAccount,
+        setter: str,
+        getter: str,
+        value: Any,
         owner: LocalAccount
 ) -> None:
-    """Test update address registry"""
-    marketplace_base_mock.updateAddressRegistryAddress(address, {'from': owner})
-    assert marketplace_base_mock.getAddressRegistryAddress() == address
-
-
-@given(address=strategy('address'))
-def test_update_address_registry_address_unauthorized(
-        marketplace_base_mock: ProjectContract,
-        address: LocalAccount,
-        user: LocalAccount
-) -> None:
-    """Test update address registry - unauthorized"""
-    with reverts("Ownable: caller is not the owner"):
-        marketplace_base_mock.updateAddressRegistryAddress(address, {'from': user})
-
-
-def test_update_min_bid_increment_amount(marketplace_base_mock: ProjectContract, owner: LocalAccount) -> None:
-    """Test update min bid increment amount"""
-    amount = 5
-    marketplace_base_mock.updateMinBidIncrementAmount(amount, {'from': owner})
-    assert marketplace_base_mock.getMinBidIncrementAmount() == amount
-
-
-def test_update_address_min_bid_increment_amount_unauthorized(
-        marketplace_base_mock: ProjectContract,
-        user: LocalAccount
-) -> None:
-    """Test update min bid increment amount - unauthorized"""
-    with reverts("Ownable: caller is not the owner"):
-        marketplace_base_mock.updateMinBidIncrementAmount(5, {'from': user})
-
-
-def test_update_auction_fee(marketplace_base_mock: ProjectContract, owner: LocalAccount) -> None:
-    """Test update auction fee"""
-    amount = 5
-    marketplace_base_mock.updateAuctionFee(amount, {'from': owner})
-    assert marketplace_base_mock.getAuctionFee() == amount
-
-
-def test_update_auction_fee_unauthorized(marketplace_base_mock: ProjectContract, user: LocalAccount) -> None:
-    """Test update auction fee - unauthorized"""
-    with reverts("Ownable: caller is not the owner"):
-        marketplace_base_mock.updateAuctionFee(5, {'from': user})
-
-
-def test_update_listing_fee(marketplace_base_mock: ProjectContract, owner: LocalAccount) -> None:
-    """Test update listing fee"""
-    amount = 5
-    marketplace_base_mock.updateListingFee(amount, {'from': owner})
-    assert marketplace_base_mock.getListingFee() == amount
-
-
-def test_update_listing_fee_unauthorized(marketplace_base_mock: ProjectContract, user: LocalAccount) -> None:
-    """Test update listing fee - unauthorized"""
-    with reverts("Ownable: caller is not the owner"):
-        marketplace_base_mock.updateListingFee(5, {'from': user})
-
-
-def test_update_offer_fee(marketplace_base_mock: ProjectContract, owner: LocalAccount) -> None:
-    """Test update offer fee"""
-    amount = 5
-    marketplace_base_mock.updateOfferFee(amount, {'from': owner})
-    assert marketplace_base_mock.getOfferFee() == amount
-
-
-def test_update_offer_fee_unauthorized(marketplace_base_mock: ProjectContract, user: LocalAccount) -> None:
-    """Test update offer fee - unauthorized"""
-    with reverts("Ownable: caller is not the owner"):
-        marketplace_base_mock.updateOfferFee(5, {'from': user})
-
-
-@given(address=strategy('address'))
-def test_update_fee_recipient(
-        marketplace_base_mock: ProjectContract,
-        address: LocalAccount,
-        owner: LocalAccount
-) -> None:
-    """Test update fee recipient"""
-    marketplace_base_mock.updateFeeRecipient(address, {'from': owner})
-    assert marketplace_base_mock.getFeeRecipient() == address
-
-
-@given(address=strategy('address'))
-def test_update_fee_recipient_unauthorized(
-        marketplace_base_mock: ProjectContract,
-        address: LocalAccount,
-        user: LocalAccount
-) -> None:
-    """Test update fee recipient - unauthorized"""
-    with reverts("Ownable: caller is not the owner"):
-        marketplace_base_mock.updateFeeRecipient(address, {'from': user})
-
-
-def test_escrow_offer_payment_tokens(marketplace_base_mock: ProjectContract, owner: LocalAccount) -> None:
-    """Test update escrow offer payment tokens"""
-    value = True
-    marketplace_base_mock.updateEscrowOfferPaymentTokens(value, {'from': owner})
-    assert marketplace_base_mock.getEscrowOfferPaymentTokens() == value
+    """Test update marketplace parameter"""
+    getattr(marketplace_base_mock, setter)(value, {'from': owner})
+    assert getattr(marketplace_base_mock, getter)() == value
 
 
-def test_escrow_offer_payment_tokens_unauthorized(
+@pytest.mark.parametrize('setter,value', list({setter: value for setter, _, value in UPDATE_PARAMS}.items()))
+def test_update_unauthorized(
         marketplace_base_mock: ProjectContract,
+        setter: str,
+        value: Any,
         user: LocalAccount
 ) -> None:
-    """Test update escrow offer payment tokens - unauthorized"""
+    """Test update marketplace parameter - unauthorized"""
+    # only the revert matters, so the setter is evaluated via eth_call instead of mining a failed transaction
     with reverts("Ownable: caller is not the owner"):
-        marketplace_base_mock.updateEscrowOfferPaymentTokens(True, {'from': user})
+        getattr(marketplace_base_mock, setter).call(value, {'from': user})
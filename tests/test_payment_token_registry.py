@@ -1,8 +1,15 @@
-from brownie import reverts, PaymentTokenRegistry
+from brownie import reverts, PaymentTokenRegistry, ZERO_ADDRESS
 from brownie.test import given, strategy
-from utils.constants import TOMB_TOKEN
+from hypothesis import example, settings
+from utils.constants import TOMB_TOKEN, TEST_ADDRESSES, MAX_ADDRESS
 from brownie.network.contract import ProjectContract
 from brownie.network.account import LocalAccount
+from utils.helpers import assert_single_event
+
+
+# every example is an on-chain call, a handful of addresses is enough for these checks
+# brownie reverts the chain before each example, so they all start from the fixture state
+MAX_EXAMPLES = 10
 
 
 def test_add_when_not_owner(payment_token_registry: ProjectContract, user: LocalAccount) -> None:
@@ -11,6 +18,9 @@ def test_add_when_not_owner(payment_token_registry: ProjectContract, user: Local
 
 
 @given(token_address=strategy('address'))
+@settings(max_examples=MAX_EXAMPLES)
+@example(token_address=ZERO_ADDRESS)
+@example(token_address=MAX_ADDRESS)
 def test_add_token(
         payment_token_registry: ProjectContract,
         token_address: LocalAccount,
@@ -21,9 +31,18 @@ def test_add_token(
     tx = payment_token_registry.add(token_address, {"from": owner})
 
     assert payment_token_registry.isEnabled(token_address)
-    assert len(tx.events) == 1
-    assert tx.events["PaymentTokenAdded"] is not None
-    assert tx.events["PaymentTokenAdded"]["token"] == token_address
+    assert_single_event(tx, "PaymentTokenAdded", token=token_address)
+
+
+def test_add_batch(payment_token_registry: ProjectContract, owner: LocalAccount) -> None:
+    tokens = list(TEST_ADDRESSES[1:])
+
+    assert not any([payment_token_registry.isEnabled(token) for token in tokens])
+
+    tx = payment_token_registry.addBatch(tokens, {"from": owner})
+
+    assert all([payment_token_registry.isEnabled(token) for token in tokens])
+    assert [event["token"] for event in tx.events["PaymentTokenAdded"]] == tokens
 
 
 def test_add_already_enabled_token(payment_token_registry: ProjectContract, owner: LocalAccount) -> None:
@@ -40,12 +59,13 @@ def test_remove_token(payment_token_registry: ProjectContract, owner: LocalAccou
     tx = payment_token_registry.remove(TOMB_TOKEN, {"from": owner})
 
     assert payment_token_registry.isEnabled(TOMB_TOKEN) is False
-    assert len(tx.events) == 1
-    assert tx.events["PaymentTokenRemoved"] is not None
-    assert tx.events["PaymentTokenRemoved"]["token"] == TOMB_TOKEN
+    assert_single_event(tx, "PaymentTokenRemoved", token=TOMB_TOKEN)
 
 
 @given(token_address=strategy('address'))
+@settings(max_examples=MAX_EXAMPLES)
+@example(token_address=ZERO_ADDRESS)
+@example(token_address=MAX_ADDRESS)
 def test_remove_non_existent_token(
         payment_token_registry: ProjectContract,
         token_address: LocalAccount,
@@ -5,6 +5,7 @@ from brownie.test import given, strategy
 from brownie.network.contract import ProjectContract
 from brownie.network.account import LocalAccount
 from typing import Callable
+from utils.helpers import calculate_royalty_fee, wait_for_txs
 
 
 @pytest.fixture(scope="session")
@@ -27,7 +28,7 @@ class TokenParams:
     token_id: int = 1_000_000
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def setup_registry_with_default(
         royalty_registry: ProjectContract,
         erc1155_collection_mock: ProjectContract,
@@ -41,7 +42,7 @@ def setup_registry_with_default(
     return setup_registry_with_default_
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def setup_registry_with_token(
         royalty_registry: ProjectContract,
         erc1155_collection_mock: ProjectContract,
@@ -49,30 +50,32 @@ def setup_registry_with_token(
         token_owner: LocalAccount
 ) -> Callable:
     def setup_registry_with_token_() -> None:
-        erc1155_collection_mock.mint(token_owner, TokenParams.token_id, 1, '')
-        royalty_registry.setTokenRoyalty(
-            erc1155_collection_mock,
-            TokenParams.token_id,
-            royalty_recipient,
-            RoyaltyParams.fraction,
-            {'from': token_owner}
-        )
+        # the chain mines transactions in the order they are sent, so the royalty is set after the mint
+        wait_for_txs([
+            erc1155_collection_mock.mint(token_owner, TokenParams.token_id, 1, '', {'required_confs': 0}),
+            royalty_registry.setTokenRoyalty(
+                erc1155_collection_mock,
+                TokenParams.token_id,
+                royalty_recipient,
+                RoyaltyParams.fraction,
+                {'from': token_owner, 'required_confs': 0}
+            )
+        ])
     return setup_registry_with_token_
 
 
 @pytest.mark.parametrize("setup_function", ['setup_registry_with_default', 'setup_registry_with_token'])
 def test_royalty_info(
+        request: pytest.FixtureRequest,
         royalty_registry: ProjectContract,
         setup_function: str,
-        setup_registry_with_default: Callable,
-        setup_registry_with_token: Callable,
         erc1155_collection_mock: ProjectContract,
         royalty_recipient: LocalAccount
 ) -> None:
     """Test royalty info"""
 
-    # dynamically call setup function
-    locals()[setup_function]()
+    # resolve and call only the parametrized setup fixture
+    request.getfixturevalue(setup_function)()
 
     sale_price = 10_000
 
@@ -81,7 +84,7 @@ def test_royalty_info(
     )
 
     assert returned_recipient == royalty_recipient.address
-    assert royalty_amount == sale_price * RoyaltyParams.fraction / 10_000
+    assert royalty_amount == calculate_royalty_fee(sale_price, RoyaltyParams.fraction)
 
 
 def test_set_default_royalty(
@@ -1,4 +1,6 @@
-from brownie import Wei
+import os
+from brownie import Wei, ZERO_ADDRESS
+from hypothesis import Phase
 
 # default erc721 collection constants
 COLLECTION_MINT_FEE = Wei('1 ether')
@@ -17,3 +19,14 @@ TEST_TOKEN_OWNER_AMOUNT = 10_000_000
 TEST_TOKEN_USER_AMOUNT = 1_000_000
 TEST_TOKEN_USER_2_AMOUNT = 1_000_000
 TEST_TOKEN_USER_3_AMOUNT = 1_000_000
+
+# representative addresses for address setter tests
+TEST_ADDRESSES = (
+    ZERO_ADDRESS,
+    '0x9Cc2F0FD184E93049A9a6C6C63bc258A39D4B54D',
+    '0x5A4b203939F9757A703e009fA9B733Cf33d5821b',
+)
+MAX_ADDRESS = '0xFFfFfFffFFfffFFfFFfFFFFFffFFFffffFfFFFfF'
+
+# hypothesis phases for stateful tests, explain and shrink phases are skipped on CI
+STATEFUL_PHASES = [Phase.explicit, Phase.reuse, Phase.generate] if os.environ.get('CI') else list(Phase)
@@ -1,17 +1,45 @@
-import math
+from typing import Any, Iterable
+from brownie.network.transaction import TransactionReceipt
+
+# marketplace fees are in per mille, royalties in basis points
+FEE_DENOMINATOR = 1_000
+ROYALTY_DENOMINATOR = 10_000
 
 
 def calculate_auction_fee(sell_price: int, percents: int) -> int:
-    return math.floor(sell_price * percents / 1_000)
+    return sell_price * percents // FEE_DENOMINATOR
 
 
 def calculate_listing_fee(sell_price: int, percents: int) -> int:
-    return math.floor(sell_price * percents / 1_000)
+    return sell_price * percents // FEE_DENOMINATOR
 
 
 def calculate_offer_fee(sell_price: int, percents: int) -> int:
-    return math.floor(sell_price * percents / 1_000)
+    return sell_price * percents // FEE_DENOMINATOR
 
 
 def calculate_royalty_fee(price: int, percents: int) -> int:
-    return math.floor(price * percents / 10_000)
+    return price * percents // ROYALTY_DENOMINATOR
+
+
+def assert_event(tx: TransactionReceipt, name: str, **expected: Any) -> None:
+    # look up the decoded event once and compare all expected fields against it
+    event = tx.events[name]
+    assert event is not None
+    for field, value in expected.items():
+        assert event[field] == value, f'{name}.{field}: {event[field]} != {value}'
+
+
+def assert_single_event(tx: TransactionReceipt, name: str, **expected: Any) -> None:
+    # the transaction must emit exactly one event, the decoded events are cached on the receipt
+    assert len(tx.events) == 1
+    assert_event(tx, name, **expected)
+
+
+def wait_for_txs(txs: Iterable[TransactionReceipt]) -> None:
+    # transactions broadcast with required_confs=0 are confirmed one after another, only pending ones are waited for
+    # (wait() reports already confirmed receipts to stdout), a reverted transaction does not raise here
+    for tx in txs:
+        if tx.status == -1:
+            tx.wait(1)
+        assert tx.status == 1, f'{tx.fn_name} reverted: {tx.revert_msg}'